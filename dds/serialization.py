@@ -3,16 +3,389 @@ CDR (Common Data Representation) serialization for DDS.
 Handles message serialization/deserialization.
 """
 
+import hashlib
+import importlib
 import struct
+import sys
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union, Type
+from array import array
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union, Type, get_args, get_origin, get_type_hints
 from dataclasses import dataclass, fields, is_dataclass
-from enum import Enum, IntEnum
-import io
-from message import timer, lifecycle, action, base
+from enum import Enum
 from core import Message, trace_logger
 
 
+@dataclass(frozen=True)
+class _StructSet:
+    """Precompiled struct codecs for the CDR primitives in one byte order"""
+    boolean: struct.Struct
+    i8: struct.Struct
+    u8: struct.Struct
+    i16: struct.Struct
+    u16: struct.Struct
+    i32: struct.Struct
+    u32: struct.Struct
+    i64: struct.Struct
+    u64: struct.Struct
+    f32: struct.Struct
+    f64: struct.Struct
+
+
+def _struct_set(endianness: str) -> _StructSet:
+    """Compile the primitive struct codecs for a byte order"""
+    return _StructSet(*(struct.Struct(endianness + code) for code in '?bBhHiIqQfd'))
+
+
+_LE_STRUCTS = _struct_set('<')
+_BE_STRUCTS = _struct_set('>')
+
+# Byte order of array.array buffers on this host
+_NATIVE_ENDIANNESS = '<' if sys.byteorder == 'little' else '>'
+
+# Element types packed as one contiguous block: type -> (format character, size)
+_ARRAY_TYPES = {
+    float: ('d', 8),
+    int: ('i', 4),
+}
+
+
+# Size class limits for pooled encode buffers; larger buffers share the last pool
+_BUFFER_CLASSES = (1024, 65536)
+_BUFFER_POOLS = tuple(deque(maxlen=64) for _ in range(len(_BUFFER_CLASSES) + 1))
+
+
+def _buffer_pool(size: int) -> deque:
+    """Pool holding buffers of the given size's class"""
+    for index, limit in enumerate(_BUFFER_CLASSES):
+        if size <= limit:
+            return _BUFFER_POOLS[index]
+    return _BUFFER_POOLS[-1]
+
+
+def _acquire_buffer(size: int) -> bytearray:
+    """Reuse a pooled buffer from size's class or allocate one"""
+    pool = _buffer_pool(size)
+    if pool:
+        return pool.pop()
+    return bytearray(size)
+
+
+def _release_buffer(buf: bytearray):
+    """Return an encode buffer to its size class pool"""
+    try:
+        buf.append(0)  # Fails while views of the buffer are still alive
+    except BufferError:
+        return
+    del buf[-1]
+    _buffer_pool(len(buf)).append(buf)
+
+
+# Field types the generated codecs write inline: type -> (struct name, size, format character)
+_INLINE_SCALARS = {
+    bool: ('s_bool', 1, '?'),
+    int: ('s_i32', 4, 'i'),
+    float: ('s_f64', 8, 'd'),
+}
+
+# Field codec tags, assigned once per dataclass field
+_TAG_SCALAR = 'scalar'  # bool/int/float written inline
+_TAG_ENUM = 'enum'  # Written inline as its int32 value
+_TAG_STRING = 'string'
+_TAG_BYTES = 'bytes'
+_TAG_ARRAY = 'array'  # List of an _ARRAY_TYPES element
+_TAG_DATACLASS = 'dataclass'
+_TAG_SEQUENCE = 'sequence'  # List of any other element type
+_TAG_MAP = 'map'
+_TAG_OPTIONAL = 'optional'  # Presence flag, then the value if set
+_TAG_TYPED = 'typed'  # Resolved at runtime by the typed-value codecs
+
+# Tags whose values pack inline as single struct fields
+_INLINE_TAGS = (_TAG_SCALAR, _TAG_ENUM)
+
+
+def _optional_inner(value_type: Any) -> Any:
+    """Non-None part of an Optional[...] type, or None if not Optional"""
+    if get_origin(value_type) is not Union:
+        return None
+    args = get_args(value_type)
+    if type(None) not in args:
+        return None
+    args = tuple(arg for arg in args if arg is not type(None))
+    return args[0] if len(args) == 1 else Union[args]
+
+
+@lru_cache(maxsize=None)
+def _classify(value_type: Any) -> Tuple[str, Any]:
+    """Codec tag and its argument (element/key-value/inner type) for a type"""
+    if value_type in _INLINE_SCALARS:
+        return _TAG_SCALAR, value_type
+    if value_type == str:
+        return _TAG_STRING, None
+    if value_type == bytes:
+        return _TAG_BYTES, None
+    origin = get_origin(value_type)
+    if origin is list:
+        args = get_args(value_type)
+        elem_type = args[0] if args else Any
+        if elem_type in _ARRAY_TYPES:
+            return _TAG_ARRAY, _ARRAY_TYPES[elem_type]
+        return _TAG_SEQUENCE, elem_type
+    if origin is dict:
+        args = get_args(value_type)
+        return _TAG_MAP, (args[0] if args else Any, args[1] if len(args) > 1 else Any)
+    if origin is Union:
+        inner = _optional_inner(value_type)
+        return (_TAG_OPTIONAL, inner) if inner is not None else (_TAG_TYPED, None)
+    # Only real classes reach issubclass; typing constructs would raise
+    if isinstance(value_type, type):
+        if issubclass(value_type, Enum):
+            return _TAG_ENUM, value_type
+        if is_dataclass(value_type):
+            return _TAG_DATACLASS, value_type
+    return _TAG_TYPED, None
+
+
+def _field_tag(field_type: Any) -> str:
+    """Classify a declared field type into a codec tag"""
+    tag = _classify(field_type)[0]
+    if tag in (_TAG_SEQUENCE, _TAG_MAP, _TAG_OPTIONAL):
+        return _TAG_TYPED
+    return tag
+
+
+def _scalar_spec(tag: str, field_type: Any) -> Tuple[str, int, str]:
+    """Inline (struct name, size, format character) for a scalar or enum field"""
+    if tag == _TAG_ENUM:
+        return _INLINE_SCALARS[int]
+    return _INLINE_SCALARS[field_type]
+
+
+def _enum_member(enum_cls: Type, value: Any) -> Enum:
+    """Look up an enum member by value, skipping EnumMeta.__call__ when possible"""
+    member = enum_cls._value2member_map_.get(value)
+    return member if member is not None else enum_cls(value)
+
+
+@lru_cache(maxsize=None)
+def _dataclass_plan(cls: Type) -> Tuple[Tuple[str, str, Any, bool], ...]:
+    """Per-class (field name, codec tag, value type, is Optional) descriptors"""
+    try:
+        hints = get_type_hints(cls)
+    except (NameError, TypeError):  # Unresolvable forward references
+        hints = {}
+        
+    plan = []
+    for field in fields(cls):
+        field_type = hints.get(field.name, field.type)
+        inner = _optional_inner(field_type)
+        optional = inner is not None
+        if optional:
+            # Encode the value as its non-None type behind the presence flag
+            field_type = inner
+        plan.append((field.name, _field_tag(field_type), field_type, optional))
+    return tuple(plan)
+
+
+# Zero padding indexed by length
+_PADDING = tuple(bytes(n) for n in range(8))
+
+# Class attribute opting a dataclass into __post_init__ after decoding
+_CDR_POST_INIT = '_cdr_post_init'
+
+# Generated (serialize, deserialize) functions keyed by (class, endianness)
+_CODECS: Dict[Tuple[Type, str], Tuple[Any, Any]] = {}
+
+
+def _emit_call(lines: List[str], indent: str, call: str):
+    """Emit a stream method call with the local cursor synced around it"""
+    lines.append(f'{indent}self._pos = pos')
+    lines.append(f'{indent}{call}')
+    lines.append(f'{indent}pos = self._pos')
+
+
+def _emit_write(lines: List[str], indent: str, tag: str, field_type: Any, index: int):
+    """Emit source writing field value v<index> at buf[pos]"""
+    var = f'v{index}'
+    if tag in _INLINE_TAGS:
+        codec, size, _ = _scalar_spec(tag, field_type)
+        value = f'{var}._value_' if tag == _TAG_ENUM else var
+        lines.append(f'{indent}if len(buf) < pos + {size * 2}:')
+        lines.append(f'{indent}    buf.extend(bytes(len(buf) + {size * 2}))')
+        if size > 1:
+            lines.append(f'{indent}pad = -pos & {size - 1}')
+            lines.append(f'{indent}if pad:')
+            lines.append(f'{indent}    buf[pos:pos + pad] = PAD[pad]')
+            lines.append(f'{indent}    pos += pad')
+        lines.append(f'{indent}{codec}.pack_into(buf, pos, {value})')
+        lines.append(f'{indent}pos += {size}')
+    elif tag == _TAG_STRING:
+        lines.append(f"{indent}data = {var}.encode('utf-8')")
+        lines.append(f'{indent}size = len(data) + 1')
+        lines.append(f'{indent}if len(buf) < pos + size + 8:')
+        lines.append(f'{indent}    buf.extend(bytes(len(buf) + size + 8))')
+        lines.append(f'{indent}pad = -pos & 3')
+        lines.append(f'{indent}if pad:')
+        lines.append(f'{indent}    buf[pos:pos + pad] = PAD[pad]')
+        lines.append(f'{indent}    pos += pad')
+        lines.append(f'{indent}s_u32.pack_into(buf, pos, size)')
+        lines.append(f'{indent}pos += 4')
+        lines.append(f'{indent}buf[pos:pos + size - 1] = data')
+        lines.append(f'{indent}buf[pos + size - 1] = 0')
+        lines.append(f'{indent}pos += size')
+    elif tag == _TAG_BYTES:
+        _emit_call(lines, indent, f'self._write_bytes({var})')
+    elif tag == _TAG_ARRAY:
+        code, size = _ARRAY_TYPES[field_type.__args__[0]]
+        _emit_call(lines, indent, f"self._write_primitive_array({var}, '{code}', {size})")
+    elif tag == _TAG_DATACLASS:
+        _emit_call(lines, indent, f'self._serialize_dataclass({var})')
+    else:
+        _emit_call(lines, indent, f'self._serialize_typed_value({var}, T{index})')
+
+
+def _emit_read(lines: List[str], indent: str, tag: str, field_type: Any, index: int):
+    """Emit source reading field value v<index> from mv[pos]"""
+    var = f'v{index}'
+    if tag in _INLINE_TAGS:
+        codec, size, _ = _scalar_spec(tag, field_type)
+        if size > 1:
+            lines.append(f'{indent}pos += -pos & {size - 1}')
+        lines.append(f'{indent}{var} = {codec}.unpack_from(mv, pos)[0]')
+        lines.append(f'{indent}pos += {size}')
+        if tag == _TAG_ENUM:
+            lines.append(f'{indent}{var} = enum_member(T{index}, {var})')
+    elif tag == _TAG_STRING:
+        lines.append(f'{indent}pos += -pos & 3')
+        lines.append(f'{indent}size = s_u32.unpack_from(mv, pos)[0]')
+        lines.append(f'{indent}pos += 4')
+        lines.append(f"{indent}{var} = str(mv[pos:pos + size - 1], 'utf-8') if size else ''")
+        lines.append(f'{indent}pos += size')
+    elif tag == _TAG_BYTES:
+        _emit_call(lines, indent, f'{var} = self._read_bytes()')
+    elif tag == _TAG_ARRAY:
+        code, size = _ARRAY_TYPES[field_type.__args__[0]]
+        _emit_call(lines, indent, f"{var} = self._read_primitive_array('{code}', {size})")
+    elif tag == _TAG_DATACLASS:
+        _emit_call(lines, indent, f'{var} = self._deserialize_dataclass(T{index})')
+    else:
+        _emit_call(lines, indent, f'{var} = self._deserialize_typed_value(T{index})')
+
+
+def _run_structs(endianness: str, specs: List[Tuple[str, int, str]]) -> Tuple[struct.Struct, ...]:
+    """One Struct per start offset (mod the widest alignment) for a scalar run"""
+    widest = max(size for _, size, _ in specs)
+    variants = []
+    for phase in range(widest):
+        fmt = [endianness]
+        pos = phase
+        for _, size, code in specs:
+            pad = -pos & (size - 1)
+            if pad:
+                fmt.append(f'{pad}x')
+            fmt.append(code)
+            pos += pad + size
+        variants.append(struct.Struct(''.join(fmt)))
+    return tuple(variants)
+
+
+def _generate_codec(cls: Type, endianness: str) -> Tuple[Any, Any]:
+    """Compile straight-line serialize/deserialize functions for a dataclass"""
+    structs = _LE_STRUCTS if endianness == '<' else _BE_STRUCTS
+    namespace = {
+        'cls': cls,
+        'PAD': _PADDING,
+        's_bool': structs.boolean,
+        's_i32': structs.i32,
+        's_u32': structs.u32,
+        's_f64': structs.f64,
+        'enum_member': _enum_member,
+    }
+    ser = ['def serialize(self, obj):', '    buf = self._buf', '    pos = self._pos']
+    de = ['def deserialize(self):', '    mv = self._mv', '    pos = self._pos']
+    plan = _dataclass_plan(cls)
+    
+    for index, (name, tag, field_type, optional) in enumerate(plan):
+        namespace[f'T{index}'] = field_type
+        ser.append(f'    v{index} = obj.{name}')
+        
+    index = 0
+    while index < len(plan):
+        tag, field_type, optional = plan[index][1:]
+        
+        # Consecutive required scalars share a single pack/unpack call
+        end = index
+        while end < len(plan) and not plan[end][3] and plan[end][1] in _INLINE_TAGS:
+            end += 1
+        if end - index > 1:
+            run = f'RUN{index}'
+            specs = [_scalar_spec(*plan[i][1:3]) for i in range(index, end)]
+            namespace[run] = _run_structs(endianness, specs)
+            enums = [i for i in range(index, end) if plan[i][1] == _TAG_ENUM]
+            values = ', '.join(f'v{i}._value_' if i in enums else f'v{i}'
+                               for i in range(index, end))
+            targets = ', '.join(f'v{i}' for i in range(index, end))
+            phase = max(size for _, size, _ in specs) - 1
+            ser.append(f'    run = {run}[pos & {phase}]')
+            ser.append('    if len(buf) < pos + run.size:')
+            ser.append('        buf.extend(bytes(len(buf) + run.size))')
+            ser.append(f'    run.pack_into(buf, pos, {values})')
+            ser.append('    pos += run.size')
+            de.append(f'    run = {run}[pos & {phase}]')
+            de.append(f'    {targets}, = run.unpack_from(mv, pos)')
+            de.append('    pos += run.size')
+            for i in enums:
+                de.append(f'    v{i} = enum_member(T{i}, v{i})')
+            index = end
+            continue
+            
+        if optional:
+            # Presence flag, then the value only when set
+            ser.append(f'    present = v{index} is not None')
+            ser.append('    if len(buf) < pos + 2:')
+            ser.append('        buf.extend(bytes(len(buf) + 2))')
+            ser.append('    s_bool.pack_into(buf, pos, present)')
+            ser.append('    pos += 1')
+            ser.append('    if present:')
+            _emit_write(ser, '        ', tag, field_type, index)
+            de.append('    present = s_bool.unpack_from(mv, pos)[0]')
+            de.append('    pos += 1')
+            de.append(f'    v{index} = None')
+            de.append('    if present:')
+            _emit_read(de, '        ', tag, field_type, index)
+        else:
+            _emit_write(ser, '    ', tag, field_type, index)
+            _emit_read(de, '    ', tag, field_type, index)
+        index += 1
+            
+    ser.append('    self._pos = pos')
+    de.append('    self._pos = pos')
+    
+    # Build the instance field by field, skipping __init__'s keyword handling
+    de.append('    obj = cls.__new__(cls)')
+    frozen = cls.__dataclass_params__.frozen
+    if frozen:
+        namespace['setattr_'] = object.__setattr__
+    for index, (name, *_) in enumerate(plan):
+        de.append(f"    setattr_(obj, '{name}', v{index})" if frozen else f'    obj.{name} = v{index}')
+    if getattr(cls, _CDR_POST_INIT, False):
+        de.append('    obj.__post_init__()')
+    de.append('    return obj')
+    
+    source = '\n'.join(ser) + '\n\n' + '\n'.join(de) + '\n'
+    exec(compile(source, f'<cdr codec {cls.__qualname__}>', 'exec'), namespace)
+    return namespace['serialize'], namespace['deserialize']
+
+
+def _dataclass_codec(cls: Type, endianness: str) -> Tuple[Any, Any]:
+    """Get (or generate) the codec pair for a dataclass"""
+    codec = _CODECS.get((cls, endianness))
+    if codec is None:
+        codec = _CODECS[(cls, endianness)] = _generate_codec(cls, endianness)
+    return codec
+
+
 class CDREncapsulation(Enum):
     """CDR Encapsulation schemes"""
     CDR_BE = 0x0000  # Big Endian
@@ -25,28 +398,26 @@ class CDREncapsulation(Enum):
     DELIMITED_CDR2_LE = 0x0009  # Delimited CDR2 Little Endian
 
 
-class CDRSerializer:
-    """
-    CDR serializer for DDS messages.
-    Implements OMG CDR specification for ROS2/DDS compatibility.
-    """
+class _CDRStream:
+    """Cursor and struct codecs shared by the CDR writer and reader"""
     
-    def __init__(self, encapsulation: CDREncapsulation = CDREncapsulation.CDR_LE):
-        self.encapsulation = encapsulation
-        self.endianness = '<' if 'LE' in encapsulation.name else '>'
-        self._buffer = io.BytesIO()
-        self._offset = 0
-        
-    def serialize_message(self, msg: Any) -> bytes:
-        """Serialize a message to CDR format"""
-        start_time = time.time()
-        
-        # Reset buffer
-        self._buffer = io.BytesIO()
-        self._offset = 0
+    def __init__(self, endianness: str):
+        self.endianness = endianness
+        self._pos = 0
+        self._s = _LE_STRUCTS if endianness == '<' else _BE_STRUCTS
+
+
+class _CDRWriter(_CDRStream):
+    """Single-use CDR output stream over an encode buffer"""
+    
+    def __init__(self, endianness: str, buf: bytearray):
+        super().__init__(endianness)
+        self._buf = buf
         
+    def write_message(self, encapsulation: CDREncapsulation, msg: Any):
+        """Encode header and message into the output buffer"""
         # Write encapsulation header
-        self._write_encapsulation_header()
+        self._write_encapsulation_header(encapsulation)
         
         # Serialize message fields
         if isinstance(msg, Message) or is_dataclass(msg):
@@ -57,150 +428,71 @@ class CDRSerializer:
         # Add padding to 4-byte boundary
         self._align(4)
         
-        # Get serialized data
-        data = self._buffer.getvalue()
-        
-        serialization_time = time.time() - start_time
-        
-        trace_logger.log_event(
-            "dds_cdr_serialize",
-            {
-                "message_type": type(msg).__name__,
-                "size_bytes": len(data),
-                "time_us": int(serialization_time * 1e6)
-            }
-        )
-        
-        return data
-        
-    def deserialize_message(self, data: bytes, message_type: Type) -> Any:
-        """Deserialize CDR data to message"""
-        start_time = time.time()
-        
-        # Reset buffer
-        self._buffer = io.BytesIO(data)
-        self._offset = 0
-        
-        # Read encapsulation header
-        self._read_encapsulation_header()
-        
-        # Deserialize message
-        if is_dataclass(message_type):
-            msg = self._deserialize_dataclass(message_type)
-        else:
-            msg = self._deserialize_object(message_type)
-        
-        deserialization_time = time.time() - start_time
-        
-        trace_logger.log_event(
-            "dds_cdr_deserialize",
-            {
-                "message_type": message_type.__name__,
-                "size_bytes": len(data),
-                "time_us": int(deserialization_time * 1e6)
-            }
-        )
-        
-        return msg
-        
-    def _write_encapsulation_header(self):
+    def _write_encapsulation_header(self, encapsulation: CDREncapsulation):
         """Write CDR encapsulation header"""
         # Encapsulation identifier (2 bytes)
-        self._write_uint16(self.encapsulation.value)
+        self._write_uint16(encapsulation.value)
         # Options (2 bytes) - reserved, must be 0
         self._write_uint16(0)
         
-    def _read_encapsulation_header(self):
-        """Read CDR encapsulation header"""
-        encap_id = self._read_uint16()
-        options = self._read_uint16()
-        
-        # Update endianness based on encapsulation
-        if encap_id & 0x0001:  # Little endian
-            self.endianness = '<'
-        else:  # Big endian
-            self.endianness = '>'
-            
     def _serialize_object(self, obj: Any):
         """Serialize an object recursively"""
-        if obj is None:
-            self._write_bool(False)  # Null indicator
-        elif isinstance(obj, bool):
-            self._write_bool(obj)
+        # Exact builtin types dispatch directly; subclasses take the ladder below
+        writer = self._OBJECT_WRITERS.get(type(obj))
+        if writer is not None:
+            writer(self, obj)
         elif isinstance(obj, int):
-            # Determine integer size based on value
-            if -128 <= obj <= 127:
-                self._write_int8(obj)
-            elif -32768 <= obj <= 32767:
-                self._write_int16(obj)
-            elif -2147483648 <= obj <= 2147483647:
-                self._write_int32(obj)
-            else:
-                self._write_int64(obj)
+            self._write_smallest_int(obj)
         elif isinstance(obj, float):
             self._write_float64(obj)
         elif isinstance(obj, str):
             self._write_string(obj)
-        elif isinstance(obj, bytes):
-            self._write_sequence(obj, self._write_uint8)
+        elif isinstance(obj, (bytes, bytearray, memoryview)):
+            self._write_bytes(obj)
         elif isinstance(obj, (list, tuple)):
-            self._write_sequence(obj, self._serialize_object)
+            self._write_object_sequence(obj)
         elif isinstance(obj, dict):
             self._serialize_dict(obj)
         elif isinstance(obj, Enum):
-            self._write_int32(obj.value)
-        elif isinstance(obj, IntEnum):
-            self._write_int32(int(obj))
+            self._write_int32(obj._value_)
         elif is_dataclass(obj):
             self._serialize_dataclass(obj)
         else:
             # Try to serialize as string representation
             self._write_string(str(obj))
             
-    def _deserialize_object(self, obj_type: Type) -> Any:
-        """Deserialize an object based on type"""
-        if obj_type == bool:
-            return self._read_bool()
-        elif obj_type == int:
-            return self._read_int32()
-        elif obj_type == float:
-            return self._read_float64()
-        elif obj_type == str:
-            return self._read_string()
-        elif obj_type == bytes:
-            return bytes(self._read_sequence(self._read_uint8))
-        elif hasattr(obj_type, '__origin__'):  # Generic types
-            if obj_type.__origin__ == list:
-                elem_type = obj_type.__args__[0] if obj_type.__args__ else Any
-                return self._read_sequence(lambda: self._deserialize_object(elem_type))
-            elif obj_type.__origin__ == dict:
-                key_type = obj_type.__args__[0] if len(obj_type.__args__) > 0 else Any
-                val_type = obj_type.__args__[1] if len(obj_type.__args__) > 1 else Any
-                return self._deserialize_dict(key_type, val_type)
-        elif issubclass(obj_type, Enum):
-            value = self._read_int32()
-            return obj_type(value)
-        elif is_dataclass(obj_type):
-            return self._deserialize_dataclass(obj_type)
+    def _write_null(self, obj: None):
+        """Write the null indicator"""
+        self._write_bool(False)
+        
+    def _write_smallest_int(self, obj: int):
+        """Write an untyped integer with the smallest width that holds it"""
+        if -128 <= obj <= 127:
+            self._write_int8(obj)
+        elif -32768 <= obj <= 32767:
+            self._write_int16(obj)
+        elif -2147483648 <= obj <= 2147483647:
+            self._write_int32(obj)
         else:
-            raise ValueError(f"Cannot deserialize type {obj_type}")
+            self._write_int64(obj)
             
+    def _write_bytes(self, obj: bytes):
+        """Write a byte string as a uint8 sequence in one copy"""
+        if isinstance(obj, memoryview):
+            obj = obj.cast('B')
+        size = len(obj)
+        self._write_uint32(size)
+        self._ensure(size)
+        self._buf[self._pos:self._pos + size] = obj
+        self._pos += size
+        
+    def _write_object_sequence(self, seq):
+        """Write a sequence of untyped objects"""
+        self._write_sequence(seq, self._serialize_object)
+        
     def _serialize_dataclass(self, obj):
         """Serialize a dataclass"""
-        for field in fields(obj):
-            value = getattr(obj, field.name)
-            
-            # Handle optional fields
-            if hasattr(field.type, '__origin__') and field.type.__origin__ == Union:
-                # Check if it's Optional (Union with None)
-                if type(None) in field.type.__args__:
-                    if value is None:
-                        self._write_bool(False)  # Not present
-                        continue
-                    else:
-                        self._write_bool(True)  # Present
-                        
-            self._serialize_typed_value(value, field.type)
+        _dataclass_codec(type(obj), self.endianness)[0](self, obj)
             
     def _serialize_typed_value(self, value: Any, field_type: Type):
         """Serialize a value with known type information"""
@@ -212,62 +504,27 @@ class CDRSerializer:
             self._write_float64(value)
         elif field_type == str:
             self._write_string(value)
-        elif hasattr(field_type, '__origin__'):
-            if field_type.__origin__ == list:
-                elem_type = field_type.__args__[0] if field_type.__args__ else Any
-                self._write_sequence(value, lambda x: self._serialize_typed_value(x, elem_type))
-            elif field_type.__origin__ == dict:
-                self._serialize_dict(value)
-        elif issubclass(field_type, Enum):
-            self._write_int32(value.value)
-        elif is_dataclass(field_type):
-            self._serialize_dataclass(value)
+        elif field_type == bytes:
+            self._write_bytes(value)
         else:
-            self._serialize_object(value)
-            
-    def _deserialize_dataclass(self, cls: Type) -> Any:
-        """Deserialize a dataclass"""
-        values = {}
-        
-        for field in fields(cls):
-            # Handle optional fields
-            if hasattr(field.type, '__origin__') and field.type.__origin__ == Union:
-                if type(None) in field.type.__args__:
-                    present = self._read_bool()
-                    if not present:
-                        values[field.name] = None
-                        continue
-                        
-            values[field.name] = self._deserialize_typed_value(field.type)
+            tag, arg = _classify(field_type)
+            if tag == _TAG_ARRAY:
+                self._write_primitive_array(value, *arg)
+            elif tag == _TAG_SEQUENCE:
+                self._write_sequence(value, lambda x: self._serialize_typed_value(x, arg))
+            elif tag == _TAG_MAP:
+                self._serialize_dict(value)
+            elif tag == _TAG_OPTIONAL:
+                self._write_bool(value is not None)
+                if value is not None:
+                    self._serialize_typed_value(value, arg)
+            elif tag == _TAG_ENUM:
+                self._write_int32(value._value_)
+            elif tag == _TAG_DATACLASS:
+                self._serialize_dataclass(value)
+            else:
+                self._serialize_object(value)
             
-        return cls(**values)
-        
-    def _deserialize_typed_value(self, field_type: Type) -> Any:
-        """Deserialize a value with known type information"""
-        if field_type == bool:
-            return self._read_bool()
-        elif field_type == int:
-            return self._read_int32()
-        elif field_type == float:
-            return self._read_float64()
-        elif field_type == str:
-            return self._read_string()
-        elif hasattr(field_type, '__origin__'):
-            if field_type.__origin__ == list:
-                elem_type = field_type.__args__[0] if field_type.__args__ else Any
-                return self._read_sequence(lambda: self._deserialize_typed_value(elem_type))
-            elif field_type.__origin__ == dict:
-                key_type = field_type.__args__[0] if len(field_type.__args__) > 0 else Any
-                val_type = field_type.__args__[1] if len(field_type.__args__) > 1 else Any
-                return self._deserialize_dict(key_type, val_type)
-        elif issubclass(field_type, Enum):
-            value = self._read_int32()
-            return field_type(value)
-        elif is_dataclass(field_type):
-            return self._deserialize_dataclass(field_type)
-        else:
-            return self._deserialize_object(field_type)
-        
     def _serialize_dict(self, d: Dict):
         """Serialize a dictionary as a map"""
         self._write_uint32(len(d))
@@ -275,79 +532,86 @@ class CDRSerializer:
             self._serialize_object(key)
             self._serialize_object(value)
             
-    def _deserialize_dict(self, key_type: Type, val_type: Type) -> Dict:
-        """Deserialize a dictionary"""
-        length = self._read_uint32()
-        result = {}
-        for _ in range(length):
-            key = self._deserialize_object(key_type)
-            value = self._deserialize_object(val_type)
-            result[key] = value
-        return result
-            
     # Primitive type writers
     def _write_bool(self, value: bool):
-        self._align(1)
-        self._buffer.write(struct.pack('?', value))
-        self._offset += 1
+        self._ensure(1)
+        self._s.boolean.pack_into(self._buf, self._pos, value)
+        self._pos += 1
         
     def _write_int8(self, value: int):
-        self._align(1)
-        self._buffer.write(struct.pack('b', value))
-        self._offset += 1
+        self._ensure(1)
+        self._s.i8.pack_into(self._buf, self._pos, value)
+        self._pos += 1
         
     def _write_uint8(self, value: int):
-        self._align(1)
-        self._buffer.write(struct.pack('B', value))
-        self._offset += 1
+        self._ensure(1)
+        self._s.u8.pack_into(self._buf, self._pos, value)
+        self._pos += 1
         
     def _write_int16(self, value: int):
         self._align(2)
-        self._buffer.write(struct.pack(f'{self.endianness}h', value))
-        self._offset += 2
+        self._ensure(2)
+        self._s.i16.pack_into(self._buf, self._pos, value)
+        self._pos += 2
         
     def _write_uint16(self, value: int):
         self._align(2)
-        self._buffer.write(struct.pack(f'{self.endianness}H', value))
-        self._offset += 2
+        self._ensure(2)
+        self._s.u16.pack_into(self._buf, self._pos, value)
+        self._pos += 2
         
     def _write_int32(self, value: int):
         self._align(4)
-        self._buffer.write(struct.pack(f'{self.endianness}i', value))
-        self._offset += 4
+        self._ensure(4)
+        self._s.i32.pack_into(self._buf, self._pos, value)
+        self._pos += 4
         
     def _write_uint32(self, value: int):
         self._align(4)
-        self._buffer.write(struct.pack(f'{self.endianness}I', value))
-        self._offset += 4
+        self._ensure(4)
+        self._s.u32.pack_into(self._buf, self._pos, value)
+        self._pos += 4
         
     def _write_int64(self, value: int):
         self._align(8)
-        self._buffer.write(struct.pack(f'{self.endianness}q', value))
-        self._offset += 8
+        self._ensure(8)
+        self._s.i64.pack_into(self._buf, self._pos, value)
+        self._pos += 8
         
     def _write_uint64(self, value: int):
         self._align(8)
-        self._buffer.write(struct.pack(f'{self.endianness}Q', value))
-        self._offset += 8
+        self._ensure(8)
+        self._s.u64.pack_into(self._buf, self._pos, value)
+        self._pos += 8
         
     def _write_float32(self, value: float):
         self._align(4)
-        self._buffer.write(struct.pack(f'{self.endianness}f', value))
-        self._offset += 4
+        self._ensure(4)
+        self._s.f32.pack_into(self._buf, self._pos, value)
+        self._pos += 4
         
     def _write_float64(self, value: float):
         self._align(8)
-        self._buffer.write(struct.pack(f'{self.endianness}d', value))
-        self._offset += 8
+        self._ensure(8)
+        self._s.f64.pack_into(self._buf, self._pos, value)
+        self._pos += 8
         
     def _write_string(self, value: str):
         """Write string with length prefix"""
         encoded = value.encode('utf-8')
-        self._write_uint32(len(encoded) + 1)  # Include null terminator
-        self._buffer.write(encoded)
-        self._buffer.write(b'\x00')  # Null terminator
-        self._offset += len(encoded) + 1
+        size = len(encoded) + 1  # Include null terminator
+        buf = self._buf
+        pos = self._pos
+        padding = -pos & 3
+        self._ensure(padding + 4 + size)
+        if padding:
+            buf[pos:pos + padding] = _PADDING[padding]
+            pos += padding
+        self._s.u32.pack_into(buf, pos, size)
+        end = pos + 4 + size - 1
+        buf[pos + 4:end] = encoded
+        buf[end] = 0  # Null terminator
+        self._pos = end + 1
         
     def _write_sequence(self, seq: List, writer_func):
         """Write a sequence with length prefix"""
@@ -355,97 +619,331 @@ class CDRSerializer:
         for item in seq:
             writer_func(item)
             
+    def _write_primitive_array(self, seq, code: str, size: int):
+        """Write a homogeneous primitive sequence with a single pack call"""
+        count = len(seq)
+        self._write_uint32(count)
+        if count:
+            self._align(size)
+            nbytes = count * size
+            self._ensure(nbytes)
+            if type(seq) is array and seq.typecode == code and seq.itemsize == size:
+                # Already a packed buffer: copy it instead of re-packing each element
+                if self.endianness != _NATIVE_ENDIANNESS:
+                    seq = array(code, seq)
+                    seq.byteswap()
+                self._buf[self._pos:self._pos + nbytes] = memoryview(seq).cast('B')
+            else:
+                struct.pack_into(f'{self.endianness}{count}{code}', self._buf, self._pos, *seq)
+            self._pos += nbytes
+            
+    def _ensure(self, size: int):
+        """Grow the output buffer to fit size more bytes"""
+        needed = self._pos + size
+        capacity = len(self._buf)
+        if needed > capacity:
+            self._buf.extend(bytes(max(needed, capacity * 2) - capacity))
+            
+    def _align(self, alignment: int):
+        """Pad the output buffer to boundary (a power of two)"""
+        padding = -self._pos & (alignment - 1)
+        if padding:
+            self._ensure(padding)
+            self._buf[self._pos:self._pos + padding] = _PADDING[padding]
+            self._pos += padding
+            
+    # Writers for untyped objects, keyed by exact type
+    _OBJECT_WRITERS = {
+        type(None): _write_null,
+        bool: _write_bool,
+        int: _write_smallest_int,
+        float: _write_float64,
+        str: _write_string,
+        bytes: _write_bytes,
+        bytearray: _write_bytes,
+        memoryview: _write_bytes,
+        list: _write_object_sequence,
+        tuple: _write_object_sequence,
+        dict: _serialize_dict,
+    }
+
+
+class _CDRReader(_CDRStream):
+    """Single-use CDR input stream over received data"""
+    
+    def __init__(self, endianness: str, data: bytes):
+        super().__init__(endianness)
+        self._mv = memoryview(data)
+        
+    def read_message(self, message_type: Type) -> Any:
+        """Decode header and message from the input buffer"""
+        # Read encapsulation header
+        self._read_encapsulation_header()
+        
+        # Deserialize message
+        if is_dataclass(message_type):
+            msg = self._deserialize_dataclass(message_type)
+        else:
+            msg = self._deserialize_object(message_type)
+        self._mv.release()  # Release the caller's buffer
+        return msg
+        
+    def _read_encapsulation_header(self):
+        """Read CDR encapsulation header"""
+        encap_id = self._read_uint16()
+        options = self._read_uint16()
+        
+        # Update endianness based on encapsulation
+        if encap_id & 0x0001:  # Little endian
+            self.endianness = '<'
+            self._s = _LE_STRUCTS
+        else:  # Big endian
+            self.endianness = '>'
+            self._s = _BE_STRUCTS
+            
+    def _deserialize_object(self, obj_type: Type) -> Any:
+        """Deserialize an object based on type"""
+        if obj_type == bool:
+            return self._read_bool()
+        elif obj_type == int:
+            return self._read_int32()
+        elif obj_type == float:
+            return self._read_float64()
+        elif obj_type == str:
+            return self._read_string()
+        elif obj_type == bytes:
+            return self._read_bytes()
+        
+        tag, arg = _classify(obj_type)
+        if tag == _TAG_ARRAY:
+            return self._read_primitive_array(*arg)
+        elif tag == _TAG_SEQUENCE:
+            return self._read_sequence(lambda: self._deserialize_object(arg))
+        elif tag == _TAG_MAP:
+            return self._deserialize_dict(*arg)
+        elif tag == _TAG_OPTIONAL:
+            return self._deserialize_object(arg) if self._read_bool() else None
+        elif tag == _TAG_ENUM:
+            return _enum_member(obj_type, self._read_int32())
+        elif tag == _TAG_DATACLASS:
+            return self._deserialize_dataclass(obj_type)
+        else:
+            raise ValueError(f"Cannot deserialize type {obj_type}")
+            
+    def _deserialize_dataclass(self, cls: Type) -> Any:
+        """Deserialize a dataclass"""
+        return _dataclass_codec(cls, self.endianness)[1](self)
+        
+    def _deserialize_typed_value(self, field_type: Type) -> Any:
+        """Deserialize a value with known type information"""
+        # Declared types take the same classified ladder as top-level objects
+        return self._deserialize_object(field_type)
+        
+    def _deserialize_dict(self, key_type: Type, val_type: Type) -> Dict:
+        """Deserialize a dictionary"""
+        length = self._read_uint32()
+        result = {}
+        for _ in range(length):
+            key = self._deserialize_object(key_type)
+            value = self._deserialize_object(val_type)
+            result[key] = value
+        return result
+            
     # Primitive type readers
     def _read_bool(self) -> bool:
-        self._align(1)
-        value = struct.unpack_from('?', self._buffer.read(1))[0]
-        self._offset += 1
+        value = self._s.boolean.unpack_from(self._mv, self._pos)[0]
+        self._pos += 1
         return value
         
     def _read_int8(self) -> int:
-        self._align(1)
-        value = struct.unpack_from('b', self._buffer.read(1))[0]
-        self._offset += 1
+        value = self._s.i8.unpack_from(self._mv, self._pos)[0]
+        self._pos += 1
         return value
         
     def _read_uint8(self) -> int:
-        self._align(1)
-        value = struct.unpack_from('B', self._buffer.read(1))[0]
-        self._offset += 1
+        value = self._s.u8.unpack_from(self._mv, self._pos)[0]
+        self._pos += 1
         return value
         
     def _read_int16(self) -> int:
         self._align(2)
-        value = struct.unpack_from(f'{self.endianness}h', self._buffer.read(2))[0]
-        self._offset += 2
+        value = self._s.i16.unpack_from(self._mv, self._pos)[0]
+        self._pos += 2
         return value
         
     def _read_uint16(self) -> int:
         self._align(2)
-        value = struct.unpack_from(f'{self.endianness}H', self._buffer.read(2))[0]
-        self._offset += 2
+        value = self._s.u16.unpack_from(self._mv, self._pos)[0]
+        self._pos += 2
         return value
         
     def _read_int32(self) -> int:
         self._align(4)
-        value = struct.unpack_from(f'{self.endianness}i', self._buffer.read(4))[0]
-        self._offset += 4
+        value = self._s.i32.unpack_from(self._mv, self._pos)[0]
+        self._pos += 4
         return value
         
     def _read_uint32(self) -> int:
         self._align(4)
-        value = struct.unpack_from(f'{self.endianness}I', self._buffer.read(4))[0]
-        self._offset += 4
+        value = self._s.u32.unpack_from(self._mv, self._pos)[0]
+        self._pos += 4
         return value
         
     def _read_int64(self) -> int:
         self._align(8)
-        value = struct.unpack_from(f'{self.endianness}q', self._buffer.read(8))[0]
-        self._offset += 8
+        value = self._s.i64.unpack_from(self._mv, self._pos)[0]
+        self._pos += 8
         return value
         
     def _read_uint64(self) -> int:
         self._align(8)
-        value = struct.unpack_from(f'{self.endianness}Q', self._buffer.read(8))[0]
-        self._offset += 8
+        value = self._s.u64.unpack_from(self._mv, self._pos)[0]
+        self._pos += 8
         return value
         
     def _read_float32(self) -> float:
         self._align(4)
-        value = struct.unpack_from(f'{self.endianness}f', self._buffer.read(4))[0]
-        self._offset += 4
+        value = self._s.f32.unpack_from(self._mv, self._pos)[0]
+        self._pos += 4
         return value
         
     def _read_float64(self) -> float:
         self._align(8)
-        value = struct.unpack_from(f'{self.endianness}d', self._buffer.read(8))[0]
-        self._offset += 8
+        value = self._s.f64.unpack_from(self._mv, self._pos)[0]
+        self._pos += 8
         return value
         
     def _read_string(self) -> str:
         """Read string with length prefix"""
-        length = self._read_uint32()
+        start = ((self._pos + 3) & -4) + 4
+        length = self._s.u32.unpack_from(self._mv, start - 4)[0]
+        self._pos = start + length  # Skip null terminator
         if length > 0:
             # Read string without null terminator
-            data = self._buffer.read(length - 1)
-            self._buffer.read(1)  # Skip null terminator
-            self._offset += length
-            return data.decode('utf-8')
+            return str(self._mv[start:start + length - 1], 'utf-8')
         return ""
         
+    def _read_bytes(self) -> bytes:
+        """Read a uint8 sequence as a byte string in one copy"""
+        size = self._read_uint32()
+        data = bytes(self._mv[self._pos:self._pos + size])
+        self._pos += size
+        return data
+        
     def _read_sequence(self, reader_func) -> List:
         """Read a sequence with length prefix"""
         length = self._read_uint32()
         return [reader_func() for _ in range(length)]
         
+    def _read_primitive_array(self, code: str, size: int) -> List:
+        """Read a homogeneous primitive sequence with a single unpack call"""
+        count = self._read_uint32()
+        if not count:
+            return []
+        self._align(size)
+        nbytes = count * size
+        values = array(code)
+        if values.itemsize == size:
+            values.frombytes(self._mv[self._pos:self._pos + nbytes])
+            if self.endianness != _NATIVE_ENDIANNESS:
+                values.byteswap()
+            values = values.tolist()
+        else:
+            values = list(struct.unpack_from(f'{self.endianness}{count}{code}', self._mv, self._pos))
+        self._pos += nbytes
+        return values
+        
     def _align(self, alignment: int):
-        """Align buffer to boundary"""
-        current_pos = self._buffer.tell()
-        remainder = current_pos % alignment
-        if remainder != 0:
-            padding = alignment - remainder
-            self._buffer.write(b'\x00' * padding)
-            self._offset += padding
+        """Skip input padding up to boundary (a power of two)"""
+        self._pos = (self._pos + alignment - 1) & -alignment
+
+
+class CDRSerializer:
+    """
+    CDR serializer for DDS messages.
+    Implements OMG CDR specification for ROS2/DDS compatibility.
+    Holds only configuration: each call encodes or decodes through its own
+    stream, so one serializer can be shared across threads.
+    """
+    
+    def __init__(self, encapsulation: CDREncapsulation = CDREncapsulation.CDR_LE):
+        self.encapsulation = encapsulation
+        self.endianness = '<' if 'LE' in encapsulation.name else '>'
+        self._size_hint = 256  # Last encoded size, for picking a pooled buffer
+        
+    def serialize_message(self, msg: Any) -> bytes:
+        """Serialize a message to CDR format"""
+        # Only time the call when tracing will record it
+        start_ns = time.perf_counter_ns() if trace_logger.enabled else 0
+        writer = self._encode(msg)
+        
+        # Get serialized data
+        data = bytes(memoryview(writer._buf)[:writer._pos])
+        _release_buffer(writer._buf)
+        
+        if start_ns:
+            self._log_serialize(msg, len(data), start_ns)
+        return data
+        
+    def serialize_message_view(self, msg: Any) -> memoryview:
+        """Serialize a message to a view of the encode buffer, skipping the copy"""
+        start_ns = time.perf_counter_ns() if trace_logger.enabled else 0
+        writer = self._encode(msg)
+        
+        # The view owns the buffer until it is handed back with release_view
+        view = memoryview(writer._buf)[:writer._pos]
+        
+        if start_ns:
+            self._log_serialize(msg, len(view), start_ns)
+        return view
+        
+    def release_view(self, view: memoryview):
+        """Return a view's buffer from serialize_message_view to the pool"""
+        try:
+            buf = view.obj
+        except ValueError:  # Already released; never pool a buffer twice
+            return
+        view.release()
+        _release_buffer(buf)
+        
+    def _encode(self, msg: Any) -> _CDRWriter:
+        """Encode a message through a writer over a pooled buffer"""
+        writer = _CDRWriter(self.endianness, _acquire_buffer(self._size_hint))
+        writer.write_message(self.encapsulation, msg)
+        self._size_hint = writer._pos
+        return writer
+        
+    def _log_serialize(self, msg: Any, size: int, start_ns: int):
+        """Trace a completed serialization"""
+        trace_logger.log_event(
+            "dds_cdr_serialize",
+            {
+                "message_type": type(msg).__name__,
+                "size_bytes": size,
+                "time_us": (time.perf_counter_ns() - start_ns) // 1000
+            }
+        )
+        
+    def deserialize_message(self, data: bytes, message_type: Type) -> Any:
+        """Deserialize CDR data to message"""
+        start_ns = time.perf_counter_ns() if trace_logger.enabled else 0
+        msg = _CDRReader(self.endianness, data).read_message(message_type)
+        
+        if start_ns:
+            trace_logger.log_event(
+                "dds_cdr_deserialize",
+                {
+                    "message_type": message_type.__name__,
+                    "size_bytes": len(data),
+                    "time_us": (time.perf_counter_ns() - start_ns) // 1000
+                }
+            )
+        
+        return msg
+
+
+# Serializers keep no per-call state, so every TypeSupport shares this one
+_default_serializer = CDRSerializer()
 
 
 class TypeSupport:
@@ -454,22 +952,96 @@ class TypeSupport:
     def __init__(self, type_name: str, message_type: Type):
         self.type_name = type_name
         self.message_type = message_type
-        self.serializer = CDRSerializer()
+        self._type_hash: Optional[bytes] = None
+        if is_dataclass(message_type):
+            # Generate the codec at registration instead of on first use
+            _dataclass_codec(message_type, _default_serializer.endianness)
         
     def serialize(self, msg: Any) -> bytes:
         """Serialize message"""
-        return self.serializer.serialize_message(msg)
+        return _default_serializer.serialize_message(msg)
+        
+    def serialize_view(self, msg: Any) -> memoryview:
+        """Serialize message without copying out of the encode buffer"""
+        return _default_serializer.serialize_message_view(msg)
+        
+    def release_view(self, view: memoryview):
+        """Return a view from serialize_view to the buffer pool"""
+        _default_serializer.release_view(view)
         
     def deserialize(self, data: bytes) -> Any:
         """Deserialize message"""
-        return self.serializer.deserialize_message(data, self.message_type)
+        return _default_serializer.deserialize_message(data, self.message_type)
         
     def get_type_hash(self) -> bytes:
         """Get type hash for type compatibility checking"""
-        # Simplified - in real DDS this would be XCDR2 type hash
-        import hashlib
-        type_str = f"{self.type_name}:{self.message_type}"
-        return hashlib.sha256(type_str.encode()).digest()
+        if self._type_hash is None:
+            # Simplified - in real DDS this would be XCDR2 type hash
+            type_str = f"{self.type_name}:{self.message_type}"
+            self._type_hash = hashlib.sha256(type_str.encode()).digest()
+        return self._type_hash
+
+
+# Built-in ROS2 types, imported on first lookup: type name -> (module, class name)
+_BUILTIN_TYPES: Dict[str, Tuple[str, str]] = {
+    # Standard messages
+    "std_msgs/msg/String": ("message.base", "StdMsgsString"),
+    "std_msgs/msg/Int32": ("message.base", "StdMsgsInt32"),
+    "std_msgs/msg/Float64": ("message.base", "StdMsgsFloat64"),
+    "std_msgs/msg/Bool": ("message.base", "StdMsgsBool"),
+    
+    # Geometry messages
+    "geometry_msgs/msg/Twist": ("message.base", "GeometryMsgsTwist"),
+    "geometry_msgs/msg/Pose": ("message.base", "GeometryMsgsPose"),
+    
+    # Sensor messages
+    "sensor_msgs/msg/LaserScan": ("message.base", "SensorMsgsLaserScan"),
+    "sensor_msgs/msg/JointState": ("message.base", "SensorMsgsJointState"),
+    
+    # Navigation messages
+    "nav_msgs/msg/OccupancyGrid": ("message.base", "NavMsgsOccupancyGrid"),
+    
+    # Timer messages
+    "rcl_interfaces/msg/TimerEvent": ("message.timer", "TimerEvent"),
+    "rosgraph_msgs/msg/Clock": ("message.timer", "ClockMessage"),
+    
+    # Lifecycle messages
+    "lifecycle_msgs/msg/State": ("message.lifecycle", "LifecycleState"),
+    "lifecycle_msgs/msg/Transition": ("message.lifecycle", "LifecycleTransition"),
+    "lifecycle_msgs/msg/TransitionEvent": ("message.lifecycle", "TransitionEvent"),
+    
+    # Lifecycle services
+    "lifecycle_msgs/srv/GetState_Request": ("message.lifecycle", "GetStateRequest"),
+    "lifecycle_msgs/srv/GetState_Response": ("message.lifecycle", "GetStateResponse"),
+    "lifecycle_msgs/srv/GetAvailableStates_Request": ("message.lifecycle", "GetAvailableStatesRequest"),
+    "lifecycle_msgs/srv/GetAvailableStates_Response": ("message.lifecycle", "GetAvailableStatesResponse"),
+    "lifecycle_msgs/srv/GetAvailableTransitions_Request": ("message.lifecycle", "GetAvailableTransitionsRequest"),
+    "lifecycle_msgs/srv/GetAvailableTransitions_Response": ("message.lifecycle", "GetAvailableTransitionsResponse"),
+    "lifecycle_msgs/srv/ChangeState_Request": ("message.lifecycle", "ChangeStateRequest"),
+    "lifecycle_msgs/srv/ChangeState_Response": ("message.lifecycle", "ChangeStateResponse"),
+    
+    # Action messages
+    "action_msgs/msg/GoalStatus": ("message.action", "GoalStatusMessage"),
+    "action_msgs/msg/GoalStatusArray": ("message.action", "GoalStatusArray"),
+    
+    # NavigateToPose action
+    "nav2_msgs/action/NavigateToPose_Goal": ("message.action", "NavigateToPoseActionGoal"),
+    "nav2_msgs/action/NavigateToPose_Result": ("message.action", "NavigateToPoseActionResult"),
+    "nav2_msgs/action/NavigateToPose_Feedback": ("message.action", "NavigateToPoseActionFeedback"),
+    
+    # Fibonacci action
+    "example_interfaces/action/Fibonacci_Goal": ("message.action", "FibonacciActionGoal"),
+    "example_interfaces/action/Fibonacci_Result": ("message.action", "FibonacciActionResult"),
+    "example_interfaces/action/Fibonacci_Feedback": ("message.action", "FibonacciActionFeedback"),
+    
+    # Action protocol services
+    "action_msgs/srv/SendGoal_Request": ("message.action", "SendGoalRequest"),
+    "action_msgs/srv/SendGoal_Response": ("message.action", "SendGoalResponse"),
+    "action_msgs/srv/CancelGoal_Request": ("message.action", "CancelGoalRequest"),
+    "action_msgs/srv/CancelGoal_Response": ("message.action", "CancelGoalResponse"),
+    "action_msgs/srv/GetResult_Request": ("message.action", "GetResultRequest"),
+    "action_msgs/srv/GetResult_Response": ("message.action", "GetResultResponse"),
+}
 
 
 class TypeRegistry:
@@ -477,91 +1049,6 @@ class TypeRegistry:
     
     def __init__(self):
         self._types: Dict[str, TypeSupport] = {}
-        self._register_builtin_types()
-        
-    def _register_builtin_types(self):
-        """Register built-in ROS2 types"""
-        # Import message types
-        from message.base import (
-            StdMsgsString, StdMsgsInt32, StdMsgsFloat64, StdMsgsBool,
-            GeometryMsgsTwist, GeometryMsgsPose,
-            SensorMsgsLaserScan, SensorMsgsJointState,
-            NavMsgsOccupancyGrid
-        )
-        from message.timer import TimerEvent, ClockMessage
-        from message.lifecycle import (
-            LifecycleState, LifecycleTransition, TransitionEvent,
-            GetStateRequest, GetStateResponse,
-            GetAvailableStatesRequest, GetAvailableStatesResponse,
-            GetAvailableTransitionsRequest, GetAvailableTransitionsResponse,
-            ChangeStateRequest, ChangeStateResponse
-        )
-        from message.action import (
-            GoalStatusMessage, GoalStatusArray,
-            NavigateToPoseActionGoal, NavigateToPoseActionResult, NavigateToPoseActionFeedback,
-            FibonacciActionGoal, FibonacciActionResult, FibonacciActionFeedback,
-            SendGoalRequest, SendGoalResponse,
-            CancelGoalRequest, CancelGoalResponse,
-            GetResultRequest, GetResultResponse
-        )
-        
-        # Register standard message types
-        self.register_type("std_msgs/msg/String", StdMsgsString)
-        self.register_type("std_msgs/msg/Int32", StdMsgsInt32)
-        self.register_type("std_msgs/msg/Float64", StdMsgsFloat64)
-        self.register_type("std_msgs/msg/Bool", StdMsgsBool)
-        
-        # Geometry messages
-        self.register_type("geometry_msgs/msg/Twist", GeometryMsgsTwist)
-        self.register_type("geometry_msgs/msg/Pose", GeometryMsgsPose)
-        
-        # Sensor messages
-        self.register_type("sensor_msgs/msg/LaserScan", SensorMsgsLaserScan)
-        self.register_type("sensor_msgs/msg/JointState", SensorMsgsJointState)
-        
-        # Navigation messages
-        self.register_type("nav_msgs/msg/OccupancyGrid", NavMsgsOccupancyGrid)
-        
-        # Timer messages
-        self.register_type("rcl_interfaces/msg/TimerEvent", TimerEvent)
-        self.register_type("rosgraph_msgs/msg/Clock", ClockMessage)
-        
-        # Lifecycle messages
-        self.register_type("lifecycle_msgs/msg/State", LifecycleState)
-        self.register_type("lifecycle_msgs/msg/Transition", LifecycleTransition)
-        self.register_type("lifecycle_msgs/msg/TransitionEvent", TransitionEvent)
-        
-        # Lifecycle services
-        self.register_type("lifecycle_msgs/srv/GetState_Request", GetStateRequest)
-        self.register_type("lifecycle_msgs/srv/GetState_Response", GetStateResponse)
-        self.register_type("lifecycle_msgs/srv/GetAvailableStates_Request", GetAvailableStatesRequest)
-        self.register_type("lifecycle_msgs/srv/GetAvailableStates_Response", GetAvailableStatesResponse)
-        self.register_type("lifecycle_msgs/srv/GetAvailableTransitions_Request", GetAvailableTransitionsRequest)
-        self.register_type("lifecycle_msgs/srv/GetAvailableTransitions_Response", GetAvailableTransitionsResponse)
-        self.register_type("lifecycle_msgs/srv/ChangeState_Request", ChangeStateRequest)
-        self.register_type("lifecycle_msgs/srv/ChangeState_Response", ChangeStateResponse)
-        
-        # Action messages
-        self.register_type("action_msgs/msg/GoalStatus", GoalStatusMessage)
-        self.register_type("action_msgs/msg/GoalStatusArray", GoalStatusArray)
-        
-        # NavigateToPose action
-        self.register_type("nav2_msgs/action/NavigateToPose_Goal", NavigateToPoseActionGoal)
-        self.register_type("nav2_msgs/action/NavigateToPose_Result", NavigateToPoseActionResult)
-        self.register_type("nav2_msgs/action/NavigateToPose_Feedback", NavigateToPoseActionFeedback)
-        
-        # Fibonacci action
-        self.register_type("example_interfaces/action/Fibonacci_Goal", FibonacciActionGoal)
-        self.register_type("example_interfaces/action/Fibonacci_Result", FibonacciActionResult)
-        self.register_type("example_interfaces/action/Fibonacci_Feedback", FibonacciActionFeedback)
-        
-        # Action protocol services
-        self.register_type("action_msgs/srv/SendGoal_Request", SendGoalRequest)
-        self.register_type("action_msgs/srv/SendGoal_Response", SendGoalResponse)
-        self.register_type("action_msgs/srv/CancelGoal_Request", CancelGoalRequest)
-        self.register_type("action_msgs/srv/CancelGoal_Response", CancelGoalResponse)
-        self.register_type("action_msgs/srv/GetResult_Request", GetResultRequest)
-        self.register_type("action_msgs/srv/GetResult_Response", GetResultResponse)
         
     def register_type(self, type_name: str, type_class: Type):
         """Register a type for serialization"""
@@ -569,7 +1056,14 @@ class TypeRegistry:
         
     def get_type_support(self, type_name: str) -> Optional[TypeSupport]:
         """Get type support for a type"""
-        return self._types.get(type_name)
+        type_support = self._types.get(type_name)
+        if type_support is None and type_name in _BUILTIN_TYPES:
+            # Built-in types are registered on first use
+            module_name, class_name = _BUILTIN_TYPES[type_name]
+            type_class = getattr(importlib.import_module(module_name), class_name)
+            self.register_type(type_name, type_class)
+            type_support = self._types[type_name]
+        return type_support
         
     def serialize(self, type_name: str, obj: Any) -> bytes:
         """Serialize object of given type"""
@@ -587,7 +1081,7 @@ class TypeRegistry:
         
     def get_registered_types(self) -> List[str]:
         """Get list of registered type names"""
-        return list(self._types.keys())
+        return list(dict.fromkeys([*_BUILTIN_TYPES, *self._types]))
 
 
 # Global type registry instance
@@ -6,6 +6,7 @@ import argparse
 import sys
 import time
 import os
+from dataclasses import replace
 from pathlib import Path
 
 # Add parent directory to Python path to import from sibling directories
@@ -125,21 +126,27 @@ def configure_simulation(args):
         config = preset_map[args.preset]()
     else:
         # Default configuration for dummy robot
-        config = SimulationConfig()
-        config.enable_map_server = True
-        config.enable_robot_state_publisher = True
-        config.enable_joint_state_publisher = True
-        config.enable_laser_scanner = True
-        config.enable_parameter_services = True
-        config.enable_diagnostics = True
-    
-    # Override with command line arguments
-    config.simulation_time_seconds = args.time
-    config.time_scale = args.time_scale
-    
-    # Configure logging
-    config.logging.trace_file_path = args.trace_file
-    config.logging.trace_to_console = not args.no_console
+        config = SimulationConfig(
+            enable_map_server=True,
+            enable_robot_state_publisher=True,
+            enable_joint_state_publisher=True,
+            enable_laser_scanner=True,
+            enable_parameter_services=True,
+            enable_diagnostics=True
+        )
+    
+    # Override with command line arguments (configs are frozen)
+    config = replace(
+        config,
+        simulation_time_seconds=args.time,
+        time_scale=args.time_scale,
+        # Configure logging
+        logging=replace(
+            config.logging,
+            trace_file_path=args.trace_file,
+            trace_to_console=not args.no_console
+        )
+    )
     
     # Apply configuration
     if config.logging.trace_to_file:
@@ -53,6 +53,9 @@ class SingleThreadedExecutor(AtomicDEVS):
         self.work_in = self.addInPort("work_items")
         self.work_complete_out = self.addOutPort("work_complete")
         
+        # Configuration
+        self.spin_period = config.executor.spin_period_us / 1e6
+        
         # Register context
         self.context_key = context_manager.register_component(
             f"executor_{name}",
@@ -66,7 +69,7 @@ class SingleThreadedExecutor(AtomicDEVS):
                 return 0.0  # Process immediately
             else:
                 # Spin period
-                return config.executor.spin_period_us / 1e6
+                return self.spin_period
                 
         elif self.state['phase'] == 'executing':
             # Simulate callback execution time
@@ -200,6 +203,9 @@ class MultiThreadedExecutor(AtomicDEVS):
         self.work_in = self.addInPort("work_items")
         self.work_complete_out = self.addOutPort("work_complete")
         
+        # Configuration
+        self.spin_period = config.executor.spin_period_us / 1e6
+        
         # Register contexts for each thread
         self.thread_contexts = []
         contexts = context_manager.create_executor_context(name, num_threads)
@@ -216,7 +222,7 @@ class MultiThreadedExecutor(AtomicDEVS):
                 return self._get_shortest_execution_time()
             else:
                 # Spin period
-                return config.executor.spin_period_us / 1e6
+                return self.spin_period
                 
         elif self.state['phase'] == 'dispatching':
             return 0.000001  # Very fast dispatch
@@ -401,6 +407,9 @@ class StaticSingleThreadedExecutor(AtomicDEVS):
         self.work_in = self.addInPort("work_items")
         self.work_complete_out = self.addOutPort("work_complete")
         
+        # Configuration
+        self.spin_period = config.executor.spin_period_us / 1e6
+        
         # Register context
         self.context_key = context_manager.register_component(
             f"static_executor_{name}",
@@ -419,7 +428,7 @@ class StaticSingleThreadedExecutor(AtomicDEVS):
             if self._has_next_work():
                 return 0.0
             else:
-                return config.executor.spin_period_us / 1e6
+                return self.spin_period
                 
         elif self.state['phase'] == 'executing':
             # Deterministic execution time
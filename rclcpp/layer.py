@@ -78,6 +78,9 @@ class RCLCPPLayer(AtomicDEVS):
         # Graph discovery port
         self.graph_event_in = self.addInPort("graph_event_in")
         
+        # Configuration
+        self.spin_period = config.executor.spin_period_us / 1e6
+        
         # Register context
         self.context_key = context_manager.register_component(
             "rclcpp_layer",
@@ -99,7 +102,7 @@ class RCLCPPLayer(AtomicDEVS):
             
         elif self.state['executor_active']:
             # Executor spin period
-            return config.executor.spin_period_us / 1e6
+            return self.spin_period
             
         return INFINITY
         
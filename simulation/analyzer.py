@@ -2,97 +2,233 @@
 Analysis tools for ROS2 DEVS simulation.
 """
 
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Sequence
 from pathlib import Path
+from array import array
+from collections import defaultdict
+from itertools import islice
+from math import inf
+from operator import sub
 import json
 
+# Event kind flags; one name can carry several (e.g. "rcl_subscription_init")
+_PUBLISH = 1
+_SUBSCRIPTION = 2
+_INIT = 4
+_CALLBACK_START = 8
+_CALLBACK_END = 16
+
+
+def _event_kind(event_name: str) -> int:
+    """Classify a non-ros2_tracing event name into kind flags by substring"""
+    kind = 0
+    if "publish" in event_name:
+        kind |= _PUBLISH
+    elif "subscription" in event_name:
+        kind |= _SUBSCRIPTION
+    if "init" in event_name.lower():
+        kind |= _INIT
+    if "callback_start" in event_name:
+        kind |= _CALLBACK_START
+    elif "callback_end" in event_name:
+        kind |= _CALLBACK_END
+    return kind
+
+
+# ros2_tracing tracepoint names, classified by exact name
+_ROS2_EVENTS = (
+    "rcl_init", "rcl_node_init",
+    "rmw_publisher_init", "rcl_publisher_init",
+    "rclcpp_publish", "rclcpp_intra_publish", "rcl_publish", "rmw_publish",
+    "rmw_subscription_init", "rcl_subscription_init", "rclcpp_subscription_init",
+    "rclcpp_subscription_callback_added",
+    "rmw_take", "rcl_take", "rclcpp_take",
+    "rcl_service_init", "rclcpp_service_callback_added",
+    "rmw_take_request", "rmw_send_response",
+    "rmw_client_init", "rcl_client_init", "rmw_send_request", "rmw_take_response",
+    "rcl_timer_init", "rclcpp_timer_callback_added", "rclcpp_timer_link_node",
+    "rclcpp_callback_register", "callback_start", "callback_end",
+    "rcl_lifecycle_state_machine_init", "rcl_lifecycle_transition",
+    "rclcpp_executor_get_next_ready", "rclcpp_executor_wait_for_work",
+    "rclcpp_executor_execute", "rclcpp_executor_spin_some",
+)
+
+_PUBLISH_EVENTS = frozenset({
+    "rclcpp_publish", "rclcpp_intra_publish", "rcl_publish", "rmw_publish",
+})
+_SUBSCRIPTION_EVENTS = frozenset({
+    "rmw_subscription_init", "rcl_subscription_init", "rclcpp_subscription_init",
+    "rclcpp_subscription_callback_added",
+})
+_INIT_EVENTS = frozenset(event for event in _ROS2_EVENTS if event.endswith("_init"))
+_CALLBACK_START_EVENTS = frozenset({"callback_start"})
+_CALLBACK_END_EVENTS = frozenset({"callback_end"})
+
+
+def _ros2_event_kind(event: str) -> int:
+    """Kind flags of a ros2_tracing tracepoint, by set membership"""
+    kind = 0
+    for flag, events in ((_PUBLISH, _PUBLISH_EVENTS),
+                         (_SUBSCRIPTION, _SUBSCRIPTION_EVENTS),
+                         (_INIT, _INIT_EVENTS),
+                         (_CALLBACK_START, _CALLBACK_START_EVENTS),
+                         (_CALLBACK_END, _CALLBACK_END_EVENTS)):
+        if event in events:
+            kind |= flag
+    return kind
+
+
+# Event name -> kind flags; other names are classified on first sight
+_EVENT_KINDS = {
+    name: _ros2_event_kind(event)
+    for event in _ROS2_EVENTS
+    for name in (event, "ros2:" + event)
+}
+
+
+def _intervals(times: Sequence[float]) -> List[float]:
+    """Gaps between consecutive timestamps"""
+    return list(map(sub, islice(times, 1, None), times))
+
+
+def _bit_topics(bits: int, topic_names: List[str]) -> List[str]:
+    """Topic names whose bits are set in a node bitmap"""
+    return [topic for index, topic in enumerate(topic_names) if bits >> index & 1]
+
+
 class SimulationAnalyzer:
     """Analyzes simulation results and generates reports"""
     
     def __init__(self):
         self.traces = []
-        self.results = {}
+        self._results = {}
+        self._pending = False
         
     def analyze(self, traces: List[Dict]):
-        """Analyze simulation traces"""
+        """Analyze simulation traces (deferred until results are first read)"""
         self.traces = traces
+        self._pending = True
         
-        # Analyze node behavior
-        self._analyze_nodes()
-        
-        # Analyze message patterns
-        self._analyze_messages()
+    @property
+    def results(self) -> Dict[str, Any]:
+        """Analysis results, computed on first access after analyze()"""
+        if self._pending:
+            self._pending = False
+            # Analyze node behavior, message patterns and timing in one pass
+            self._analyze_all(self.traces)
+        return self._results
         
-        # Analyze timing
-        self._analyze_timing()
+    def analyze_stream(self, trace_path: str):
+        """Analyze newline-delimited JSON traces one event at a time"""
+        self._pending = False
+        with open(trace_path, "rb") as f:
+            self._analyze_all(json.loads(line) for line in f if line.strip())
         
-    def _analyze_nodes(self):
-        """Analyze node behavior and interactions"""
-        # Track nodes and their activities
-        nodes = {}
+    def _analyze_all(self, events: Iterable[Dict]):
+        """Analyze nodes, message flow and timing in a single pass over the events"""
+        nodes = defaultdict(lambda: {
+            "publisher_bits": 0,
+            "subscriber_bits": 0,
+            "services": set(),
+            "parameters": set()
+        })
+        # Topic i (in first-seen order) is bit 1 << i in the node bitmaps
+        topics = defaultdict(lambda: {
+            "publish_count": 0,
+            "subscribe_count": 0,
+            "publishers": [],
+            "subscribers": [],
+            "publish_times": array("d"),  # Packed column of publish timestamps
+            "bit": 1 << len(topics)
+        })
+        timing = {
+            "init_duration": 0,
+            "total_duration": 0,
+            "callback_durations": [],
+            "publish_intervals": {}
+        }
+        # Running bounds; the infinite seeds drop per-event None checks
+        first_init = first_event = inf
+        last_init = last_event = -inf
+        pending_starts = {}
+        kinds = _EVENT_KINDS
+        callback_durations = timing["callback_durations"]
         
-        for event in self.traces:
-            if "node_name" in event:
-                node_name = event["node_name"]
-                if node_name not in nodes:
-                    nodes[node_name] = {
-                        "publishers": set(),
-                        "subscribers": set(),
-                        "services": set(),
-                        "parameters": set()
-                    }
-                    
-                # Track node activities
-                if "topic" in event:
-                    if "publish" in event.get("event", ""):
-                        nodes[node_name]["publishers"].add(event["topic"])
-                    elif "subscription" in event.get("event", ""):
-                        nodes[node_name]["subscribers"].add(event["topic"])
+        for event in events:
+            event_name = event.get("event", "")
+            kind = kinds.get(event_name)
+            if kind is None:
+                kind = kinds[event_name] = _event_kind(event_name)
+            is_publish = kind & _PUBLISH
+            is_subscription = kind & _SUBSCRIPTION
+            timestamp = float(event.get("timestamp", 0))
+            has_topic = "topic" in event
+            has_node = "node_name" in event
+            
+            # Track messages by topic
+            if has_topic:
+                info = topics[event["topic"]]
+                if is_publish:
+                    info["publish_count"] += 1
+                    info["publish_times"].append(timestamp)
+                elif is_subscription:
+                    info["subscribe_count"] += 1
+                        
+            # Track nodes and their activities
+            if has_node:
+                node = nodes[event["node_name"]]
+                if has_topic:
+                    if is_publish:
+                        node["publisher_bits"] |= info["bit"]
+                    elif is_subscription:
+                        node["subscriber_bits"] |= info["bit"]
                         
                 if "service_name" in event:
-                    nodes[node_name]["services"].add(event["service_name"])
+                    node["services"].add(event["service_name"])
                     
                 if "parameter" in event:
-                    nodes[node_name]["parameters"].add(event["parameter"])
+                    node["parameters"].add(event["parameter"])
                     
-        self.results["nodes"] = {
+            # Initialization phase and total duration bounds
+            if kind & _INIT:
+                if timestamp < first_init:
+                    first_init = timestamp
+                if timestamp > last_init:
+                    last_init = timestamp
+            if timestamp < first_event:
+                first_event = timestamp
+            if timestamp > last_event:
+                last_event = timestamp
+                
+            # Pair each callback end with the latest pending start on its thread
+            if kind & _CALLBACK_START:
+                pending_starts.setdefault(event.get("vtid"), []).append(timestamp)
+            elif kind & _CALLBACK_END:
+                starts = pending_starts.get(event.get("vtid"))
+                if starts:
+                    callback_durations.append(timestamp - starts.pop())
+                    
+        # Expand the node bitmaps into both sides of each relation
+        topic_names = list(topics)
+        for name, info in nodes.items():
+            info["publishers"] = _bit_topics(info["publisher_bits"], topic_names)
+            info["subscribers"] = _bit_topics(info["subscriber_bits"], topic_names)
+            for topic in info["publishers"]:
+                topics[topic]["publishers"].append(name)
+            for topic in info["subscribers"]:
+                topics[topic]["subscribers"].append(name)
+                
+        self._results["nodes"] = {
             name: {
-                "publishers": list(info["publishers"]),
-                "subscribers": list(info["subscribers"]),
+                "publishers": info["publishers"],
+                "subscribers": info["subscribers"],
                 "services": list(info["services"]),
                 "parameters": list(info["parameters"])
             }
             for name, info in nodes.items()
         }
         
-    def _analyze_messages(self):
-        """Analyze message flow patterns"""
-        # Track messages by topic
-        topics = {}
-        
-        for event in self.traces:
-            if "topic" in event:
-                topic = event["topic"]
-                if topic not in topics:
-                    topics[topic] = {
-                        "publish_count": 0,
-                        "subscribe_count": 0,
-                        "publishers": set(),
-                        "subscribers": set()
-                    }
-                    
-                # Count messages
-                if "publish" in event.get("event", ""):
-                    topics[topic]["publish_count"] += 1
-                    if "node_name" in event:
-                        topics[topic]["publishers"].add(event["node_name"])
-                        
-                elif "subscription" in event.get("event", ""):
-                    topics[topic]["subscribe_count"] += 1
-                    if "node_name" in event:
-                        topics[topic]["subscribers"].add(event["node_name"])
-                        
-        self.results["topics"] = {
+        self._results["topics"] = {
             topic: {
                 "publish_count": info["publish_count"],
                 "subscribe_count": info["subscribe_count"],
@@ -102,71 +238,42 @@ class SimulationAnalyzer:
             for topic, info in topics.items()
         }
         
-    def _analyze_timing(self):
-        """Analyze timing patterns"""
-        # Track timing information
-        timing = {
-            "init_duration": 0,
-            "total_duration": 0,
-            "callback_durations": [],
-            "publish_intervals": {}
-        }
-        
-        # Find initialization phase
-        init_events = [
-            event for event in self.traces
-            if "init" in event.get("event", "").lower()
-        ]
-        if init_events:
-            first_init = min(float(event.get("timestamp", 0)) for event in init_events)
-            last_init = max(float(event.get("timestamp", 0)) for event in init_events)
+        if first_init <= last_init:
             timing["init_duration"] = last_init - first_init
-            
-        # Calculate total duration
-        if self.traces:
-            first_event = min(float(event.get("timestamp", 0)) for event in self.traces)
-            last_event = max(float(event.get("timestamp", 0)) for event in self.traces)
+        if first_event <= last_event:
             timing["total_duration"] = last_event - first_event
             
-        # Analyze callback durations
-        for i, event in enumerate(self.traces):
-            if "callback_start" in event.get("event", ""):
-                # Find matching end
-                for j in range(i+1, len(self.traces)):
-                    if "callback_end" in self.traces[j].get("event", ""):
-                        duration = float(self.traces[j].get("timestamp", 0)) - float(event.get("timestamp", 0))
-                        timing["callback_durations"].append(duration)
-                        break
-                        
         # Calculate publish intervals by topic
-        for topic in self.results.get("topics", {}):
-            publish_times = []
-            for event in self.traces:
-                if (event.get("topic") == topic and 
-                    "publish" in event.get("event", "")):
-                    publish_times.append(float(event.get("timestamp", 0)))
-                    
-            if len(publish_times) > 1:
-                intervals = [
-                    publish_times[i+1] - publish_times[i]
-                    for i in range(len(publish_times)-1)
-                ]
+        for topic, info in topics.items():
+            times = info["publish_times"]
+            if len(times) > 1:
+                intervals = _intervals(times)
+                shortest = min(intervals)
+                if shortest < 0:
+                    # Out-of-order trace: sort this topic's column once
+                    intervals = _intervals(sorted(times))
+                    shortest = min(intervals)
                 timing["publish_intervals"][topic] = {
-                    "min": min(intervals),
+                    "min": shortest,
                     "max": max(intervals),
                     "avg": sum(intervals) / len(intervals)
                 }
                 
-        self.results["timing"] = timing
+        self._results["timing"] = timing
         
-    def save_results(self, output_dir: str):
-        """Save analysis results"""
+    def save_results(self, output_dir: str, compact: bool = False):
+        """Save analysis results (compact=True writes single-line JSON)"""
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
-        # Save full results
+        # Save full results in one write; compact output also runs json's
+        # C encoder (indented output falls back to the Python one)
+        if compact:
+            data = json.dumps(self.results, separators=(",", ":"))
+        else:
+            data = json.dumps(self.results, indent=2)
         with open(output_path / "analysis.json", "w") as f:
-            json.dump(self.results, f, indent=2)
+            f.write(data)
             
         # Save summary
         with open(output_path / "summary.txt", "w") as f:
@@ -3,10 +3,23 @@ Configuration for ROS2 DEVS simulation.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional
+import copy
+import os
 import yaml
 
-@dataclass
+# libyaml-backed loader when available
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _load_yaml(file_path: str, mtime_ns: int) -> Dict:
+    """Parse a YAML file; the modification time keys the cache"""
+    with open(file_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+@dataclass(slots=True, frozen=True)
 class DDSConfig:
     """DDS layer configuration"""
     domain_id: int = 0
@@ -18,7 +31,7 @@ class DDSConfig:
     enable_shared_memory: bool = True
     enable_security: bool = False
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Logging configuration"""
     trace_to_file: bool = True
@@ -26,13 +39,13 @@ class LoggingConfig:
     trace_to_console: bool = True
     default_log_level: str = "INFO"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecutorConfig:
     """Executor configuration"""
     spin_period_us: int = 100
     callback_duration_us: int = 10
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SimulationConfig:
     """Complete simulation configuration"""
     # System components
@@ -57,9 +70,10 @@ class SimulationConfig:
     @classmethod
     def from_yaml(cls, file_path: str) -> 'SimulationConfig':
         """Load configuration from YAML file"""
-        with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
-        return cls(**data)
+        data = _load_yaml(file_path, os.stat(file_path).st_mtime_ns)
+        # Configs are frozen, but nested YAML dicts/lists pass through as-is
+        # and stay mutable, so never share the cached parse with callers
+        return cls(**copy.deepcopy(data))
 
 class ConfigPresets:
     """Common configuration presets"""
@@ -67,33 +81,30 @@ class ConfigPresets:
     @staticmethod
     def development() -> SimulationConfig:
         """Development configuration with all debug features enabled"""
-        config = SimulationConfig()
-        config.logging.default_log_level = "DEBUG"
-        return config
+        return SimulationConfig(
+            logging=LoggingConfig(default_log_level="DEBUG")
+        )
         
     @staticmethod
     def production() -> SimulationConfig:
         """Production configuration optimized for performance"""
-        config = SimulationConfig()
-        config.logging.trace_to_console = False
-        config.executor.spin_period_us = 50
-        return config
+        return SimulationConfig(
+            logging=LoggingConfig(trace_to_console=False),
+            executor=ExecutorConfig(spin_period_us=50)
+        )
         
     @staticmethod
     def testing() -> SimulationConfig:
         """Testing configuration with predictable behavior"""
-        config = SimulationConfig()
-        config.time_scale = 0.1
-        return config
+        return SimulationConfig(time_scale=0.1)
         
     @staticmethod
     def benchmark() -> SimulationConfig:
         """Benchmark configuration for performance testing"""
-        config = SimulationConfig()
-        config.logging.trace_to_console = False
-        config.logging.trace_to_file = True
-        config.time_scale = 10.0
-        return config
+        return SimulationConfig(
+            logging=LoggingConfig(trace_to_console=False, trace_to_file=True),
+            time_scale=10.0
+        )
 
 # Global configuration instance
 config = SimulationConfig() 
\ No newline at end of file
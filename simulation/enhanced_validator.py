@@ -6,10 +6,42 @@ Provides comprehensive validation at multiple levels.
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import deque
+from array import array
+from itertools import islice
+from operator import sub
 import json
 import time
 from pathlib import Path
 
+# Event kind flags; one name can carry several (e.g. "rclcpp_publish_error")
+_NODE_INIT = 1
+_RCLCPP_PUBLISH = 2
+_SUBSCRIPTION = 4
+_PUBLISH = 8
+_RMW_TAKE = 16
+_ERROR = 32
+
+# Event name -> kind flags, filled in as names are first seen
+_EVENT_KINDS: Dict[str, int] = {}
+
+def _event_kind(event_name: str) -> int:
+    """Classify an event name into kind flags by substring"""
+    kind = 0
+    if "rcl_node_init" in event_name:
+        kind |= _NODE_INIT
+    if "rclcpp_publish" in event_name:
+        kind |= _RCLCPP_PUBLISH
+    elif "subscription" in event_name:
+        kind |= _SUBSCRIPTION
+    if "publish" in event_name:
+        kind |= _PUBLISH
+    if "rmw_take" in event_name:
+        kind |= _RMW_TAKE
+    if "error" in event_name.lower():
+        kind |= _ERROR
+    return kind
+
 class ValidationLevel(Enum):
     """Validation levels from basic to comprehensive"""
     BASIC = "basic"
@@ -42,13 +74,38 @@ class ValidationResult:
     details: Optional[Dict[str, Any]] = None
     timestamp: float = field(default_factory=time.time)
 
+@dataclass
+class TraceIndex:
+    """Trace events grouped by kind and topic in a single pass"""
+    node_inits: List[str] = field(default_factory=list)
+    publishes: List[int] = field(default_factory=list)  # rclcpp_publish, in trace order
+    publishes_by_topic: Dict[str, List[int]] = field(default_factory=dict)
+    subscribes_by_topic: Dict[str, List[int]] = field(default_factory=dict)
+    takes_by_topic: Dict[str, List[int]] = field(default_factory=dict)
+    publish_times_by_topic: Dict[Any, List[Any]] = field(default_factory=dict)  # any "publish" event
+    error_indices: List[int] = field(default_factory=list)
+
 class EnhancedValidator:
     """Enhanced validator with comprehensive validation capabilities"""
     
+    # Rule name -> validation method
+    _DISPATCH = {
+        "node_initialization_order": "_validate_node_initialization_order",
+        "required_topics_exist": "_validate_required_topics",
+        "message_flow_patterns": "_validate_message_flow_patterns",
+        "qos_profile_consistency": "_validate_qos_consistency",
+        "timing_patterns": "_validate_timing_patterns",
+        "latency_bounds": "_validate_latency_bounds",
+        "throughput_requirements": "_validate_throughput_requirements",
+        "resource_usage_patterns": "_validate_resource_usage",
+        "error_handling": "_validate_error_handling",
+    }
+    
     def __init__(self, validation_level: ValidationLevel = ValidationLevel.STANDARD):
         self.validation_level = validation_level
         self.results: List[ValidationResult] = []
         self.rules = self._create_validation_rules()
+        self._index: Optional[TraceIndex] = None
         
     def _create_validation_rules(self) -> List[ValidationRule]:
         """Create validation rules based on level"""
@@ -127,13 +184,15 @@ class EnhancedValidator:
     def validate(self, traces: List[Dict], system_config: Dict = None) -> Dict[str, Any]:
         """Run comprehensive validation"""
         self.results.clear()
+        self._index = None
         
         print(f"🔍 Running {self.validation_level.value} validation...")
         
-        # Run all enabled rules
+        # Run all enabled rules; they share one index of the traces
         for rule in self.rules:
             if rule.enabled:
                 self._run_validation_rule(rule, traces, system_config)
+        self._index = None
         
         # Generate summary
         summary = self._generate_summary()
@@ -148,27 +207,46 @@ class EnhancedValidator:
             "summary": summary
         }
     
+    def _trace_index(self, traces: List[Dict]) -> TraceIndex:
+        """Index of the traces being validated, built by the first rule that needs it"""
+        if self._index is None:
+            self._index = self._index_traces(traces)
+        return self._index
+    
+    def _index_traces(self, traces: List[Dict]) -> TraceIndex:
+        """Classify every event once, grouping event indices by kind and topic"""
+        index = TraceIndex()
+        kinds = _EVENT_KINDS
+        for i, event in enumerate(traces):
+            event_name = event.get("event", "")
+            # Substring tests run once per distinct name, not once per event
+            if event_name in kinds:
+                kind = kinds[event_name]
+            else:
+                kind = kinds[event_name] = _event_kind(event_name)
+            if not kind:
+                continue
+            if kind & _NODE_INIT:
+                index.node_inits.append(event.get("node_name", "unknown"))
+            if kind & _RCLCPP_PUBLISH:
+                index.publishes.append(i)
+                index.publishes_by_topic.setdefault(event.get("topic", "unknown"), []).append(i)
+            elif kind & _SUBSCRIPTION:
+                index.subscribes_by_topic.setdefault(event.get("topic", "unknown"), []).append(i)
+            if kind & _PUBLISH:
+                index.publish_times_by_topic.setdefault(event.get("topic"), []).append(event.get("timestamp", 0))
+            if kind & _RMW_TAKE:
+                index.takes_by_topic.setdefault(event.get("topic", "unknown"), []).append(i)
+            if kind & _ERROR:
+                index.error_indices.append(i)
+        return index
+    
     def _run_validation_rule(self, rule: ValidationRule, traces: List[Dict], system_config: Dict):
         """Run a specific validation rule"""
         try:
-            if rule.name == "node_initialization_order":
-                self._validate_node_initialization_order(rule, traces)
-            elif rule.name == "required_topics_exist":
-                self._validate_required_topics(rule, traces)
-            elif rule.name == "message_flow_patterns":
-                self._validate_message_flow_patterns(rule, traces)
-            elif rule.name == "qos_profile_consistency":
-                self._validate_qos_consistency(rule, traces)
-            elif rule.name == "timing_patterns":
-                self._validate_timing_patterns(rule, traces)
-            elif rule.name == "latency_bounds":
-                self._validate_latency_bounds(rule, traces)
-            elif rule.name == "throughput_requirements":
-                self._validate_throughput_requirements(rule, traces)
-            elif rule.name == "resource_usage_patterns":
-                self._validate_resource_usage(rule, traces)
-            elif rule.name == "error_handling":
-                self._validate_error_handling(rule, traces)
+            handler = self._DISPATCH.get(rule.name)
+            if handler is not None:
+                getattr(self, handler)(rule, traces)
             else:
                 self.results.append(ValidationResult(
                     rule=rule,
@@ -184,12 +262,7 @@ class EnhancedValidator:
     
     def _validate_node_initialization_order(self, rule: ValidationRule, traces: List[Dict]):
         """Validate node initialization order"""
-        node_init_order = []
-        
-        for event in traces:
-            if "rcl_node_init" in event.get("event", ""):
-                node_name = event.get("node_name", "unknown")
-                node_init_order.append(node_name)
+        node_init_order = self._trace_index(traces).node_inits
         
         # Check for required nodes
         required_nodes = ["dummy_map_serve", "robot_state_publisher", "dummy_joint_sta"]
@@ -212,14 +285,7 @@ class EnhancedValidator:
     
     def _validate_required_topics(self, rule: ValidationRule, traces: List[Dict]):
         """Validate that required topics exist"""
-        topic_messages = {}
-        
-        for event in traces:
-            if "rclcpp_publish" in event.get("event", ""):
-                topic = event.get("topic", "unknown")
-                if topic not in topic_messages:
-                    topic_messages[topic] = []
-                topic_messages[topic].append(event)
+        topic_messages = self._trace_index(traces).publishes_by_topic
         
         required_topics = ["/map", "/robot_description", "/joint_states", "/scan"]
         missing_topics = [topic for topic in required_topics if topic not in topic_messages]
@@ -241,22 +307,21 @@ class EnhancedValidator:
     
     def _validate_message_flow_patterns(self, rule: ValidationRule, traces: List[Dict]):
         """Validate message flow patterns"""
-        # Track publisher-subscriber pairs
+        index = self._trace_index(traces)
+        publishes = index.publishes_by_topic
+        subscribes = index.subscribes_by_topic
+        
+        # Track publisher-subscriber pairs, topics in order of first appearance
+        first_seen = {topic: indices[0] for topic, indices in subscribes.items()}
+        for topic, indices in publishes.items():
+            if indices[0] < first_seen.get(topic, len(traces)):
+                first_seen[topic] = indices[0]
         pub_sub_pairs = {}
-        
-        for event in traces:
-            if "rclcpp_publish" in event.get("event", ""):
-                topic = event.get("topic", "unknown")
-                node = event.get("node_name", "unknown")
-                if topic not in pub_sub_pairs:
-                    pub_sub_pairs[topic] = {"publishers": set(), "subscribers": set()}
-                pub_sub_pairs[topic]["publishers"].add(node)
-            elif "subscription" in event.get("event", ""):
-                topic = event.get("topic", "unknown")
-                node = event.get("node_name", "unknown")
-                if topic not in pub_sub_pairs:
-                    pub_sub_pairs[topic] = {"publishers": set(), "subscribers": set()}
-                pub_sub_pairs[topic]["subscribers"].add(node)
+        for topic in sorted(first_seen, key=first_seen.get):
+            pub_sub_pairs[topic] = {
+                "publishers": {traces[i].get("node_name", "unknown") for i in publishes.get(topic, ())},
+                "subscribers": {traces[i].get("node_name", "unknown") for i in subscribes.get(topic, ())}
+            }
         
         # Check for orphaned publishers/subscribers
         orphaned_topics = []
@@ -294,16 +359,14 @@ class EnhancedValidator:
         """Validate timing patterns"""
         # Check publish intervals
         topic_intervals = {}
+        publish_times_by_topic = self._trace_index(traces).publish_times_by_topic
         
         for topic in ["/map", "/joint_states", "/scan"]:
-            publish_times = []
-            for event in traces:
-                if (event.get("topic") == topic and 
-                    "publish" in event.get("event", "")):
-                    publish_times.append(float(event.get("timestamp", 0)))
+            publish_times = array("d", map(float, publish_times_by_topic.get(topic, ())))
             
             if len(publish_times) > 1:
-                intervals = [publish_times[i+1] - publish_times[i] for i in range(len(publish_times)-1)]
+                # Pairwise differences and the stats below all run in C
+                intervals = list(map(sub, islice(publish_times, 1, None), publish_times))
                 topic_intervals[topic] = {
                     "min": min(intervals),
                     "max": max(intervals),
@@ -344,16 +407,23 @@ class EnhancedValidator:
         """Validate message latency bounds"""
         # Calculate end-to-end latency for messages
         latencies = []
-        
-        for i, event in enumerate(traces):
-            if "rclcpp_publish" in event.get("event", ""):
-                # Find corresponding take event
-                for j in range(i+1, len(traces)):
-                    if ("rmw_take" in traces[j].get("event", "") and 
-                        traces[j].get("topic") == event.get("topic")):
-                        latency = float(traces[j].get("timestamp", 0)) - float(event.get("timestamp", 0))
-                        latencies.append(latency)
-                        break
+        index = self._trace_index(traces)
+        # Per-topic queues of take indices; publishes arrive in trace order, so
+        # takes at or before a publish can never match a later one either
+        pending_takes = {}
+        
+        for i in index.publishes:
+            event = traces[i]
+            topic = event.get("topic", "unknown")
+            takes = pending_takes.get(topic)
+            if takes is None:
+                takes = pending_takes[topic] = deque(index.takes_by_topic.get(topic, ()))
+            # Find corresponding take event (the first one after the publish)
+            while takes and takes[0] <= i:
+                takes.popleft()
+            if takes:
+                latency = float(traces[takes[0]].get("timestamp", 0)) - float(event.get("timestamp", 0))
+                latencies.append(latency)
         
         if latencies:
             avg_latency = sum(latencies) / len(latencies)
@@ -385,12 +455,10 @@ class EnhancedValidator:
     def _validate_throughput_requirements(self, rule: ValidationRule, traces: List[Dict]):
         """Validate throughput requirements"""
         # Count messages per topic
-        topic_counts = {}
-        
-        for event in traces:
-            if "rclcpp_publish" in event.get("event", ""):
-                topic = event.get("topic", "unknown")
-                topic_counts[topic] = topic_counts.get(topic, 0) + 1
+        topic_counts = {
+            topic: len(indices)
+            for topic, indices in self._trace_index(traces).publishes_by_topic.items()
+        }
         
         # Calculate throughput
         if traces:
@@ -433,7 +501,7 @@ class EnhancedValidator:
     def _validate_error_handling(self, rule: ValidationRule, traces: List[Dict]):
         """Validate error handling patterns"""
         # Check for error events
-        error_events = [event for event in traces if "error" in event.get("event", "").lower()]
+        error_events = [traces[i] for i in self._trace_index(traces).error_indices]
         
         if error_events:
             self.results.append(ValidationResult(
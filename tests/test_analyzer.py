@@ -0,0 +1,68 @@
+"""
+Tests for simulation trace analysis.
+"""
+
+import sys
+import os
+import unittest
+import tempfile
+import json
+import importlib.util
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAS_PYPDEVS = importlib.util.find_spec("pypdevs") is not None
+
+if HAS_PYPDEVS:
+    from simulation.analyzer import SimulationAnalyzer
+
+
+@unittest.skipUnless(HAS_PYPDEVS, "pypdevs is not installed")
+class TestSimulationAnalyzer(unittest.TestCase):
+    """Test cases for the simulation analyzer"""
+
+    def setUp(self):
+        """Set up sample traces"""
+        self.traces = [
+            {"event": "ros2:rcl_init", "timestamp": 0.0},
+            {"event": "ros2:rcl_node_init", "node_name": "talker", "timestamp": 0.1},
+            {"event": "ros2:rcl_node_init", "node_name": "listener", "timestamp": 0.2},
+            {"event": "ros2:rcl_publisher_init", "topic": "/chatter", "node_name": "talker", "timestamp": 0.3},
+            {"event": "ros2:rcl_subscription_init", "topic": "/chatter", "node_name": "listener", "timestamp": 0.4},
+            {"event": "ros2:rclcpp_service_callback_added", "node_name": "talker",
+             "service_name": "/talker/get_parameters", "timestamp": 0.5},
+            {"event": "ros2:rclcpp_publish", "topic": "/chatter", "node_name": "talker", "timestamp": 1.0},
+            {"event": "ros2:callback_start", "vtid": 7, "timestamp": 1.1},
+            {"event": "ros2:callback_end", "vtid": 7, "timestamp": 1.3},
+            {"event": "ros2:rclcpp_publish", "topic": "/chatter", "node_name": "talker", "timestamp": 2.0},
+            # Out of order, as merged per-CPU traces can be
+            {"event": "ros2:rclcpp_publish", "topic": "/chatter", "node_name": "talker", "timestamp": 1.5},
+            {"event": "custom_publish", "topic": "/status", "node_name": "listener",
+             "parameter": "use_sim_time", "timestamp": 2.5},
+        ]
+
+    def test_analyze_stream_matches_analyze(self):
+        """Test that NDJSON input gives the same results as in-memory traces"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as tmp_file:
+            for event in self.traces:
+                tmp_file.write(json.dumps(event) + "\n")
+            tmp_file.write("\n")  # Blank lines are skipped
+            tmp_path = tmp_file.name
+
+        try:
+            streamed = SimulationAnalyzer()
+            streamed.analyze_stream(tmp_path)
+
+            in_memory = SimulationAnalyzer()
+            in_memory.analyze(self.traces)
+
+            self.assertEqual(streamed.results, in_memory.results)
+            self.assertEqual(in_memory.results["topics"]["/chatter"]["publish_count"], 3)
+            self.assertEqual(in_memory.results["timing"]["publish_intervals"]["/chatter"]["min"], 0.5)
+        finally:
+            os.unlink(tmp_path)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,80 @@
+"""
+Tests for the layered ROS2 DEVS model.
+"""
+
+import sys
+import os
+import unittest
+import random
+import importlib.util
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          "ros2_pdevs_model (1).py")
+
+
+def load_model():
+    """Import the model module from its file"""
+    spec = importlib.util.spec_from_file_location("ros2_pdevs_model", MODEL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipUnless(importlib.util.find_spec("pypdevs"), "pypdevs is not installed")
+class TestLayeredModel(unittest.TestCase):
+    """Test cases for a full simulation run"""
+
+    def setUp(self):
+        """Build a fresh model with quiet, in-memory-free tracing"""
+        random.seed(0)
+        self.model_module = load_model()
+        self.trace_logger = self.model_module.trace_logger
+        self.trace_logger.verbose = False
+        self.trace_logger.keep_in_memory = False
+        self.model = self.model_module.LayeredROS2System("LayeredROS2")
+
+    def simulate(self, duration: float):
+        """Run the model for duration simulated seconds"""
+        sim = self.model_module.Simulator(self.model)
+        sim.setClassicDEVS()
+        sim.setTerminationTime(duration)
+        sim.simulate()
+
+    def test_every_callback_start_has_an_end(self):
+        """Test that batched delivery never preempts a running callback"""
+        self.simulate(10.0)
+
+        counts = self.trace_logger.event_counts
+        running = sum(model.state.phase == "executing_callback"
+                      for model in self.model.component_set
+                      if isinstance(model, self.model_module.Subscriber))
+        self.assertGreater(counts["callback_start"], 0)
+        # Only callbacks still running at termination may lack their end
+        self.assertEqual(counts["callback_start"] - counts["callback_end"], running)
+
+    def seeded_trace_lines(self, seed: int):
+        """Trace lines of a fresh run after random.seed(seed), minus wall-clock stamps"""
+        random.seed(seed)
+        model_module = load_model()
+        trace_logger = model_module.trace_logger
+        trace_logger.verbose = False
+        sim = model_module.Simulator(model_module.LayeredROS2System("LayeredROS2"))
+        sim.setClassicDEVS()
+        sim.setTerminationTime(2.0)
+        sim.simulate()
+        # Drop the "[time of day] (+delta) " prefix
+        return [line.split(") ", 1)[1] for line in trace_logger.traces]
+
+    def test_seeded_runs_trace_identically(self):
+        """Test that random.seed() reproduces handles, GIDs and CPU ids in traces"""
+        lines = self.seeded_trace_lines(5)
+
+        self.assertGreater(len(lines), 0)
+        self.assertEqual(lines, self.seeded_trace_lines(5))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,131 @@
+"""
+Tests for CDR serialization of DDS messages.
+"""
+
+import sys
+import os
+import unittest
+import importlib.util
+from dataclasses import dataclass
+from typing import Optional
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HAS_PYPDEVS = importlib.util.find_spec("pypdevs") is not None
+
+if HAS_PYPDEVS:
+    import simulation  # dds.transport imports simulation, which imports dds back
+    from dds import serialization
+    from dds.serialization import CDREncapsulation, CDRSerializer
+
+
+@dataclass
+class Inner:
+    x: int
+    name: str
+
+
+@dataclass
+class OptionalFields:
+    count: Optional[int]
+    label: Optional[str]
+    inner: Optional[Inner]
+    missing: Optional[int] = None
+
+
+@unittest.skipUnless(HAS_PYPDEVS, "pypdevs is not installed")
+class TestCDRSerializer(unittest.TestCase):
+    """Test cases for CDR encoding and decoding"""
+
+    def setUp(self):
+        """Set up one serializer per byte order"""
+        self.serializers = [CDRSerializer(CDREncapsulation.CDR_LE),
+                            CDRSerializer(CDREncapsulation.CDR_BE)]
+
+    def round_trip(self, msg):
+        """Encode and decode a message with each serializer"""
+        return [serializer.deserialize_message(serializer.serialize_message(msg), type(msg))
+                for serializer in self.serializers]
+
+    def test_optional_fields_set(self):
+        """Test that set Optional fields decode to their values, not None"""
+        msg = OptionalFields(count=42, label="scan", inner=Inner(x=-7, name="base_link"))
+
+        for decoded in self.round_trip(msg):
+            self.assertEqual(decoded, msg)
+
+    def test_optional_fields_unset(self):
+        """Test that unset Optional fields decode to None"""
+        msg = OptionalFields(count=None, label=None, inner=None)
+
+        for decoded in self.round_trip(msg):
+            self.assertEqual(decoded, msg)
+
+    def test_optional_fields_mixed(self):
+        """Test Optional fields with falsy values next to unset ones"""
+        msg = OptionalFields(count=0, label="", inner=None, missing=3)
+
+        for decoded in self.round_trip(msg):
+            self.assertEqual(decoded, msg)
+
+    def test_serialize_message_view_matches_bytes(self):
+        """Test that the encode-buffer view holds the same bytes as serialize_message"""
+        msg = OptionalFields(count=42, label="scan", inner=Inner(x=-7, name="base_link"))
+
+        for serializer in self.serializers:
+            view = serializer.serialize_message_view(msg)
+            self.assertIsInstance(view, memoryview)
+            self.assertEqual(bytes(view), serializer.serialize_message(msg))
+            self.assertEqual(serializer.deserialize_message(view, OptionalFields), msg)
+            serializer.release_view(view)
+
+    def pooled_buffers(self):
+        """Ids of the encode buffers currently pooled"""
+        return [id(buf) for pool in serialization._BUFFER_POOLS for buf in pool]
+
+    def test_release_view_pools_buffer(self):
+        """Test that a released view's buffer is reused by the next encode"""
+        serializer = self.serializers[0]
+        msg = OptionalFields(count=1, label="a", inner=None)
+
+        view = serializer.serialize_message_view(msg)
+        buf = view.obj
+        serializer.release_view(view)
+        self.assertIn(id(buf), self.pooled_buffers())
+
+        view = serializer.serialize_message_view(msg)
+        self.assertIs(view.obj, buf)
+        serializer.release_view(view)
+
+    def test_release_view_with_live_subview(self):
+        """Test that a buffer still exported by a sub-view is never pooled"""
+        serializer = self.serializers[0]
+        msg = OptionalFields(count=1, label="a", inner=None)
+
+        view = serializer.serialize_message_view(msg)
+        expected = bytes(view)
+        buf = view.obj
+        sub = view[:]
+        serializer.release_view(view)
+        self.assertNotIn(id(buf), self.pooled_buffers())
+
+        # Later encodes must not write into the buffer the sub-view still reads
+        serializer.serialize_message(OptionalFields(count=99, label="zzzz", inner=Inner(x=5, name="b")))
+        self.assertEqual(bytes(sub), expected)
+        sub.release()
+
+    def test_double_release_view(self):
+        """Test that releasing a view twice pools its buffer only once"""
+        serializer = self.serializers[0]
+        msg = OptionalFields(count=1, label="a", inner=None)
+
+        view = serializer.serialize_message_view(msg)
+        buf = view.obj
+        serializer.release_view(view)
+        serializer.release_view(view)
+        self.assertEqual(self.pooled_buffers().count(id(buf)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)